@@ -12,12 +12,20 @@
 api.py
 
 Defines a FastAPI application to perform SSH config audits via an HTTP/JSON API.
-Relies on SSHConfigAuditor from ssh_config_checks.py for the core checks.
+Relies on the cached audit() from ssh_config_checks.py for single hosts, and on
+async_auditor.py for concurrent multi-host audits.
 """
 
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from auditor.checks.ssh_config_checks import SSHConfigAuditor
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field
+from auditor.async_auditor import (
+    DEFAULT_MAX_PARALLEL,
+    MAX_BATCH_HOSTS,
+    MAX_PARALLEL_LIMIT,
+    audit_hosts
+)
+from auditor.checks.ssh_config_checks import audit
 
 app = FastAPI(
     title="SSH Config Auditor API",
@@ -25,7 +33,8 @@ app = FastAPI(
     description=(
         "A REST API to audit SSH configurations for security best practices. "
         "Uses Paramiko to connect and retrieve sshd_config settings."
-    )
+    ),
+    default_response_class=ORJSONResponse
 )
 
 
@@ -40,6 +49,14 @@ class AuditRequest(BaseModel):
     key_file: str | None = None
 
 
+class BatchAuditRequest(BaseModel):
+    """
+    Request payload for auditing several hosts concurrently.
+    """
+    hosts: list[AuditRequest] = Field(max_length=MAX_BATCH_HOSTS)
+    max_parallel: int = Field(default=DEFAULT_MAX_PARALLEL, ge=1, le=MAX_PARALLEL_LIMIT)
+
+
 @app.post("/audit")
 def audit_ssh_config(request: AuditRequest) -> dict:
     """
@@ -54,19 +71,43 @@ def audit_ssh_config(request: AuditRequest) -> dict:
     Raises:
         HTTPException: Returns a 500 if the audit process fails.
     """
-    auditor = SSHConfigAuditor(
-        host=request.host,
-        username=request.username,
-        port=request.port,
-        password=request.password,
-        key_file=request.key_file
-    )
     try:
-        results = auditor.audit_ssh_config()
+        results = audit(
+            host=request.host,
+            username=request.username,
+            port=request.port,
+            password=request.password,
+            key_file=request.key_file
+        )
         return {"status": "OK", "results": results}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
+
+@app.post("/audit/batch")
+async def audit_ssh_config_batch(request: BatchAuditRequest) -> dict:
+    """
+    Audits the SSH configuration of many hosts concurrently.
+
+    Args:
+        request (BatchAuditRequest): Hosts to audit and the concurrency limit.
+
+    Returns:
+        dict: JSON-friendly object with one result entry per requested host,
+        in request order. Per-host failures are reported inline.
+    """
+    results = await audit_hosts(
+        (host.model_dump() for host in request.hosts),
+        max_parallel=request.max_parallel
+    )
+    return {
+        "status": "OK",
+        "results": [
+            {"host": host.host, "port": host.port, "results": result}
+            for host, result in zip(request.hosts, results)
+        ]
+    }
+
 # ------------------------------------------------------------------------------
 # Footer Notes:
 # - To deploy publicly, add authentication or IP allowlisting to secure the API.
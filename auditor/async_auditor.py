@@ -0,0 +1,150 @@
+# ------------------------------------------------------------------------------
+# File Name: async_auditor.py
+# Project: SSH Config Auditor
+# Author: _01x.arec1b0(dkrizhanovskyi)
+# License: MIT
+# Last Updated: 2024-12-25
+# Description:
+#   Audits many SSH servers concurrently using asyncio and AsyncSSH.
+# ------------------------------------------------------------------------------
+
+"""
+async_auditor.py
+
+Fans out sshd_config audits across a fleet of hosts. Each host is audited with
+AsyncSSH inside a shared event loop, so waiting on one server's handshake or
+command round trip doesn't block the others. The checks themselves are reused
+from SSHConfigAuditor.
+"""
+
+import asyncio
+import socket
+from typing import Any, Iterable
+
+import asyncssh
+from auditor.checks.ssh_config_checks import READ_SSHD_CONFIG, SSHConfigAuditor
+
+DEFAULT_MAX_PARALLEL = 50
+MAX_PARALLEL_LIMIT = 200
+MAX_BATCH_HOSTS = 1000
+TCP_CONNECT_TIMEOUT = 1.0
+
+
+async def _open_socket(host: str, port: int) -> socket.socket:
+    """
+    Opens a TCP connection with a short timeout, so unreachable hosts are
+    dropped before any SSH handshake is attempted.
+
+    Args:
+        host (str): Target server's hostname or IP address.
+        port (int): SSH port.
+
+    Returns:
+        socket.socket: A connected, non-blocking socket for AsyncSSH to use.
+
+    Raises:
+        OSError: If no address for the host accepted a connection in time.
+    """
+    loop = asyncio.get_running_loop()
+    last_error: OSError = OSError(f"No addresses found for {host}")
+    for family, type_, proto, _, addr in await loop.getaddrinfo(
+        host, port, type=socket.SOCK_STREAM
+    ):
+        sock = socket.socket(family, type_, proto)
+        sock.setblocking(False)
+        try:
+            await asyncio.wait_for(loop.sock_connect(sock, addr), TCP_CONNECT_TIMEOUT)
+            return sock
+        except asyncio.TimeoutError:
+            last_error = TimeoutError(f"TCP connect to {host}:{port} timed out")
+        except OSError as err:
+            last_error = err
+        sock.close()
+    raise last_error
+
+
+async def audit_one(
+    host: str,
+    username: str = "root",
+    port: int = 22,
+    password: str | None = None,
+    key_file: str | None = None
+) -> dict[str, str]:
+    """
+    Connects to a single host, retrieves sshd_config, and audits it.
+
+    Args:
+        host (str): Target server's hostname or IP address.
+        username (str, optional): SSH username (default "root").
+        port (int, optional): SSH port (default 22).
+        password (str | None, optional): SSH password (default None).
+        key_file (str | None, optional): Path to an SSH private key (default None).
+
+    Returns:
+        dict[str, str]: Results keyed by configuration directive name.
+    """
+    options: dict[str, Any] = {
+        "port": port,
+        "username": username,
+        "known_hosts": None,
+        "connect_timeout": 5,
+    }
+    if password:
+        options["password"] = password
+    elif key_file:
+        options["client_keys"] = [key_file]
+
+    sock = await _open_socket(host, port)
+    try:
+        async with asyncssh.connect(host, sock=sock, **options) as conn:
+            completed = await conn.run(
+                READ_SSHD_CONFIG, check=False, timeout=5, encoding=None
+            )
+            config_data = completed.stdout if completed.exit_status == 0 else b""
+    except asyncssh.Error as ssh_err:
+        return {"ConnectionError": f"SSH error: {ssh_err}"}
+    finally:
+        sock.close()
+
+    return SSHConfigAuditor.evaluate_config(config_data)
+
+
+async def audit_hosts(
+    hosts: Iterable[dict[str, Any]],
+    max_parallel: int = DEFAULT_MAX_PARALLEL
+) -> list[dict[str, str]]:
+    """
+    Audits many hosts concurrently, at most max_parallel at a time.
+
+    Args:
+        hosts (Iterable[dict[str, Any]]): Keyword arguments for audit_one, one
+            mapping per host.
+        max_parallel (int, optional): Upper bound on simultaneous connections,
+            to avoid tripping rate limits or tarpits (default 50).
+
+    Returns:
+        list[dict[str, str]]: Audit results in the same order as hosts. A host
+        whose audit raised gets {"ConnectionError": "<reason>"}.
+    """
+    semaphore = asyncio.Semaphore(max_parallel)
+
+    async def bounded(spec: dict[str, Any]) -> dict[str, str]:
+        async with semaphore:
+            return await audit_one(**spec)
+
+    outcomes = await asyncio.gather(
+        *(bounded(spec) for spec in hosts),
+        return_exceptions=True
+    )
+    return [
+        {"ConnectionError": str(outcome) or type(outcome).__name__}
+        if isinstance(outcome, Exception) else outcome
+        for outcome in outcomes
+    ]
+
+# ------------------------------------------------------------------------------
+# Footer Notes:
+# - Host keys are not verified (known_hosts=None), matching the Paramiko
+#   AutoAddPolicy used by the synchronous auditor.
+# - MIT License applies.
+# ------------------------------------------------------------------------------
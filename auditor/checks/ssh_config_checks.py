@@ -14,14 +14,61 @@ ssh_config_checks.py
 
 Implements the SSHConfigAuditor class using Paramiko to connect, retrieve, and
 evaluate an SSH server’s configuration (e.g., password auth, port, root login).
+The audit() function wraps it with a short-lived result cache for callers, such
+as the API, that may audit the same host repeatedly.
 """
 
+import functools
+import hashlib
+import itertools
+import os
+import threading
+import time
+
 import paramiko
 from auditor.utils.parser import (
-    parse_sshd_config,
+    collect_sshd_directives,
     validate_ssh_port,
     normalize_boolean_setting
 )
+from auditor.utils.credentials import credential_fingerprint
+from auditor.utils.ssh_pool import pool
+
+SSHD_CONFIG_PATH = "/etc/ssh/sshd_config"
+READ_SSHD_CONFIG = f"cat {SSHD_CONFIG_PATH}"
+SSH_BACKEND = os.environ.get("AUDITOR_SSH_BACKEND", "paramiko")
+WANTED_DIRECTIVES = frozenset({"Port", "PasswordAuthentication", "PermitRootLogin"})
+_PASSWORD_AUTH_RESULTS = {False: "Secure", True: "Insecure"}
+_ROOT_LOGIN_RESULTS = {
+    "no": "Secure",
+    "without-password": "Secure",
+    "prohibit-password": "Secure",
+    "yes": "Insecure",
+}
+AUDIT_CACHE_TTL = 60.0
+
+AuditKey = tuple[str, int, str, str | None]
+_audit_cache: dict[AuditKey, tuple[dict[str, str], float]] = {}
+_audit_cache_lock = threading.Lock()
+CONFIG_CACHE_SIZE = 1024
+_results_by_digest: dict[bytes, dict[str, str]] = {}
+_results_by_digest_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=32)
+def _load_key(path: str, mtime: float) -> paramiko.PKey:
+    """
+    Loads a private key of any supported type, memoized per file version.
+
+    Args:
+        path (str): Path to the private key file.
+        mtime (float): The file's modification time; part of the cache key
+            so that replacing the key on disk forces a reload.
+
+    Returns:
+        paramiko.PKey: The parsed key (RSA, ECDSA or Ed25519).
+    """
+    return paramiko.PKey.from_path(path)
 
 
 class SSHConfigAuditor:
@@ -55,62 +102,151 @@ class SSHConfigAuditor:
 
     def audit_ssh_config(self) -> dict[str, str]:
         """
-        Establishes an SSH connection, retrieves sshd_config, and performs audits.
+        Obtains a pooled SSH connection, retrieves sshd_config, and performs audits.
 
         Returns:
             dict[str, str]: Results keyed by configuration directive name.
         """
+        if SSH_BACKEND == "libssh2":
+            return self._audit_via_libssh2()
+
         results = {}
-        client = paramiko.SSHClient()
-        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        client = None
 
         try:
-            # Connect with password or key
-            if self.password:
-                client.connect(
-                    hostname=self.host,
-                    port=self.port,
-                    username=self.username,
-                    password=self.password,
-                    timeout=5
-                )
-            else:
-                key = None
-                if self.key_file:
-                    key = paramiko.RSAKey.from_private_key_file(self.key_file)
-                client.connect(
-                    hostname=self.host,
-                    port=self.port,
-                    username=self.username,
-                    pkey=key,
-                    timeout=5
-                )
-
-            # Retrieve sshd_config
-            sftp = client.open_sftp()
+            # Reuse a pooled connection, authenticating with password or key
+            key = None
+            if not self.password and self.key_file:
+                key = _load_key(self.key_file, os.path.getmtime(self.key_file))
+            acquire = functools.partial(
+                pool.acquire,
+                self.host,
+                self.port,
+                self.username,
+                password=self.password or None,
+                pkey=key,
+                timeout=2
+            )
+            client = acquire()
+
+            # Stream sshd_config over a plain exec channel (no SFTP subsystem
+            # handshake) and parse it line by line, hanging up as soon as
+            # every directive we check has been seen
             try:
-                with sftp.open("/etc/ssh/sshd_config", "r") as remote_file:
-                    config_data = remote_file.read().decode("utf-8")
-            except IOError:
-                config_data = ""
+                channel = client.get_transport().open_session(timeout=5)
+            except paramiko.SSHException:
+                # A pooled connection can die silently while idle (NAT
+                # timeout, sshd restart); retry once on a new connection
+                pool.discard(client)
+                client = None
+                client = acquire(reuse=False)
+                channel = client.get_transport().open_session(timeout=5)
+            try:
+                channel.settimeout(5)
+                channel.exec_command(READ_SSHD_CONFIG)
+                with channel.makefile("rb") as stdout:
+                    # An empty read is unreadable, as in evaluate_config(b"")
+                    first_line = stdout.readline()
+                    config_dict = collect_sshd_directives(
+                        itertools.chain([first_line], stdout), WANTED_DIRECTIVES
+                    ) if first_line else None
+                # Only a full read can end in a failed cat (e.g. permission
+                # denied), so the exit status is checked only in that case
+                if (
+                    config_dict is not None
+                    and len(config_dict) < len(WANTED_DIRECTIVES)
+                    and channel.recv_exit_status() != 0
+                ):
+                    config_dict = None
+            except TimeoutError:
+                config_dict = None
             finally:
-                sftp.close()
+                channel.close()
 
-            if config_data:
-                config_dict = parse_sshd_config(config_data)
-                results["PortConfig"] = self.check_port(config_dict)
-                results["PasswordAuthentication"] = self.check_password_auth(config_dict)
-                results["RootLogin"] = self.check_root_login(config_dict)
-            else:
-                results["Error"] = "Unable to retrieve sshd_config."
+            results = self.evaluate_directives(config_dict)
 
         except paramiko.SSHException as ssh_err:
             results["ConnectionError"] = f"SSH error: {ssh_err}"
         finally:
-            client.close()
+            if client is not None:
+                pool.release(client)
 
         return results
 
+    def _audit_via_libssh2(self) -> dict[str, str]:
+        """
+        Retrieves and audits sshd_config over a one-off libssh2 connection.
+
+        Returns:
+            dict[str, str]: Results keyed by configuration directive name.
+        """
+        # Imported here so ssh2-python stays optional for the default backend
+        from auditor.transports import libssh2_transport
+
+        try:
+            exit_status, config_data = libssh2_transport.run_command(
+                self.host,
+                self.port,
+                self.username,
+                READ_SSHD_CONFIG,
+                password=self.password or None,
+                key_file=self.key_file,
+                timeout=5
+            )
+        except libssh2_transport.SSH2Error as ssh_err:
+            # libssh2 errors often carry no message; fall back to their type
+            return {"ConnectionError": f"SSH error: {str(ssh_err) or type(ssh_err).__name__}"}
+        return self.evaluate_config(config_data if exit_status == 0 else b"")
+
+    @classmethod
+    def evaluate_config(cls, config_data: bytes) -> dict[str, str]:
+        """
+        Runs every check against raw sshd_config contents.
+
+        Args:
+            config_data (bytes): The raw contents of sshd_config (b"" if unreadable).
+
+        Returns:
+            dict[str, str]: Results keyed by configuration directive name.
+        """
+        if not config_data:
+            return cls.evaluate_directives(None)
+
+        # Fleets mostly share a handful of identical configs, so results are
+        # remembered by content digest and unchanged files skip the parse
+        digest = hashlib.sha256(config_data).digest()
+        with _results_by_digest_lock:
+            results = _results_by_digest.get(digest)
+        if results is None:
+            results = cls.evaluate_directives(
+                collect_sshd_directives(config_data.splitlines(), WANTED_DIRECTIVES)
+            )
+            with _results_by_digest_lock:
+                if len(_results_by_digest) >= CONFIG_CACHE_SIZE:
+                    _results_by_digest.pop(next(iter(_results_by_digest)))
+                _results_by_digest[digest] = results
+        return dict(results)
+
+    @classmethod
+    def evaluate_directives(cls, config_dict: dict[str, str] | None) -> dict[str, str]:
+        """
+        Runs every check against already-parsed sshd_config directives.
+
+        Args:
+            config_dict (dict[str, str] | None): Parsed sshd_config key-value
+                pairs, or None if the file could not be read.
+
+        Returns:
+            dict[str, str]: Results keyed by configuration directive name.
+        """
+        if config_dict is None:
+            return {"Error": "Unable to retrieve sshd_config."}
+        return {
+            "PortConfig": cls.check_port(config_dict),
+            "PasswordAuthentication": cls.check_password_auth(config_dict),
+            "RootLogin": cls.check_root_login(config_dict),
+        }
+
     @staticmethod
     def check_port(config_dict: dict[str, str]) -> str:
         """
@@ -139,12 +275,7 @@ class SSHConfigAuditor:
             str: "Secure" if no, "Insecure" if yes, or "Unknown" if not found.
         """
         value = config_dict.get("PasswordAuthentication", "yes")
-        normalized = normalize_boolean_setting(value)
-        if normalized is False:
-            return "Secure"
-        elif normalized is True:
-            return "Insecure"
-        return "Unknown"
+        return _PASSWORD_AUTH_RESULTS.get(normalize_boolean_setting(value), "Unknown")
 
     @staticmethod
     def check_root_login(config_dict: dict[str, str]) -> str:
@@ -158,18 +289,60 @@ class SSHConfigAuditor:
             str: "Secure" if no/without-password/prohibit-password,
                  "Insecure" if yes, or "Unknown" otherwise.
         """
-        value = config_dict.get("PermitRootLogin", "yes").lower()
-        if value in ["no", "without-password", "prohibit-password"]:
-            return "Secure"
-        elif value == "yes":
-            return "Insecure"
-        return "Unknown"
+        value = config_dict.get("PermitRootLogin", "yes")
+        return _ROOT_LOGIN_RESULTS.get(value.lower(), "Unknown")
+
+
+def audit(
+    host: str,
+    username: str,
+    port: int = 22,
+    password: str | None = None,
+    key_file: str | None = None
+) -> dict[str, str]:
+    """
+    Audits a host, reusing a result computed within the last AUDIT_CACHE_TTL
+    seconds for the same host, port, user and credentials.
+
+    Args:
+        host (str): Target server's hostname or IP address.
+        username (str): SSH username.
+        port (int, optional): SSH port (default 22).
+        password (str | None, optional): SSH password (default None).
+        key_file (str | None, optional): Path to an SSH private key (default None).
+
+    Returns:
+        dict[str, str]: Results keyed by configuration directive name.
+    """
+    key = (host, port, username, credential_fingerprint(password, key_file))
+    now = time.monotonic()
+    with _audit_cache_lock:
+        entry = _audit_cache.get(key)
+    if entry is not None and now - entry[1] < AUDIT_CACHE_TTL:
+        return dict(entry[0])
+
+    results = SSHConfigAuditor(
+        host=host,
+        username=username,
+        port=port,
+        password=password,
+        key_file=key_file
+    ).audit_ssh_config()
 
+    # Connection failures are usually transient; only cache real audits
+    if "ConnectionError" not in results:
+        with _audit_cache_lock:
+            cutoff = time.monotonic() - AUDIT_CACHE_TTL
+            for stale in [k for k, (_, ts) in _audit_cache.items() if ts <= cutoff]:
+                del _audit_cache[stale]
+            _audit_cache[key] = (dict(results), time.monotonic())
+    return results
 
 # ------------------------------------------------------------------------------
 # Footer Notes:
 # - Ensure that the user running Paramiko has necessary permissions
 #   to read /etc/ssh/sshd_config.
+# - The audit() cache never stores raw credentials; see utils/credentials.py.
 # - MIT License applies.
 # ------------------------------------------------------------------------------
 
@@ -16,6 +16,7 @@ the core checks to ssh_config_checks.py and uses argparse for command-line args.
 """
 
 import argparse
+import sys
 from auditor.checks.ssh_config_checks import SSHConfigAuditor
 
 
@@ -56,9 +57,10 @@ def run_audit() -> None:
     )
     results = auditor.audit_ssh_config()
 
-    print("\n=== SSH Config Auditor Results ===")
-    for key, value in results.items():
-        print(f"{key}: {value}")
+    sys.stdout.write("".join([
+        "\n=== SSH Config Auditor Results ===\n",
+        *(f"{key}: {value}\n" for key, value in results.items()),
+    ]))
 
 
 if __name__ == "__main__":
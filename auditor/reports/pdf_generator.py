@@ -3,18 +3,17 @@ pdf_generator.py - Example PDF reporting using ReportLab
 """
 
 from reportlab.lib.pagesizes import LETTER
-from reportlab.pdfgen import canvas
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Table
 
 def generate_pdf_report(results, output_file="ssh_audit_report.pdf"):
-    c = canvas.Canvas(output_file, pagesize=LETTER)
-    c.setFont("Helvetica", 12)
-
-    c.drawString(30, 750, "SSH Configuration Audit Report")
-    y_position = 700
-    for key, value in results.items():
-        c.drawString(30, y_position, f"{key}: {value}")
-        y_position -= 20
-
-    c.save()
+    # Let platypus lay out and paginate the table instead of placing each
+    # line by hand, which clipped long reports at the bottom of the page
+    styles = getSampleStyleSheet()
+    doc = SimpleDocTemplate(output_file, pagesize=LETTER, pageCompression=1)
+    data = [["Check", "Result"], *results.items()]
+    doc.build([
+        Paragraph("SSH Configuration Audit Report", styles["Title"]),
+        Table(data, repeatRows=1),
+    ])
     return output_file
-
@@ -0,0 +1,98 @@
+# ------------------------------------------------------------------------------
+# File Name: libssh2_transport.py
+# Project: SSH Config Auditor
+# Author: _01x.arec1b0(dkrizhanovskyi)
+# License: MIT
+# Last Updated: 2024-12-25
+# Description:
+#   Optional SSH transport built on libssh2 (ssh2-python) bindings.
+# ------------------------------------------------------------------------------
+
+"""
+libssh2_transport.py
+
+Runs a single remote command over libssh2, whose key exchange and packet
+handling happen in C rather than in Python as with Paramiko. Selected by
+setting AUDITOR_SSH_BACKEND=libssh2; requires the optional ssh2-python package.
+"""
+
+import socket
+
+from ssh2.error_codes import LIBSSH2_ERROR_EAGAIN
+from ssh2.exceptions import SSH2Error
+from ssh2.session import Session
+
+__all__ = ["SSH2Error", "run_command"]
+
+
+def run_command(
+    host: str,
+    port: int,
+    username: str,
+    command: str,
+    password: str | None = None,
+    key_file: str | None = None,
+    timeout: float = 5
+) -> tuple[int, bytes]:
+    """
+    Connects, authenticates, runs a command, and disconnects.
+
+    Args:
+        host (str): Target server's hostname or IP address.
+        port (int): SSH port.
+        username (str): SSH username.
+        command (str): Command line to execute remotely.
+        password (str | None, optional): SSH password (default None).
+        key_file (str | None, optional): Path to an SSH private key (default
+            None). With neither credential, the SSH agent is used.
+        timeout (float, optional): Connect and I/O timeout in seconds (default 5).
+
+    Returns:
+        tuple[int, bytes]: The command's exit status and its standard output.
+
+    Raises:
+        SSH2Error: If the handshake, authentication or channel fails.
+        OSError: If the TCP connection can't be established.
+    """
+    with socket.create_connection((host, port), timeout=timeout) as sock:
+        session = Session()
+        session.set_timeout(int(timeout * 1000))
+        session.handshake(sock)
+        try:
+            if password:
+                session.userauth_password(username, password)
+            elif key_file:
+                session.userauth_publickey_fromfile(username, key_file)
+            else:
+                session.agent_auth(username)
+
+            channel = session.open_session()
+            channel.execute(command)
+            chunks = []
+            while True:
+                size, data = channel.read()
+                if size == LIBSSH2_ERROR_EAGAIN:
+                    continue
+                if size < 0:
+                    # read() reports failures such as timeouts as a negative
+                    # code; treating them as EOF would audit a truncated file
+                    raise SSH2Error(f"Channel read failed with libssh2 error {size}")
+                if size == 0:
+                    break
+                chunks.append(data)
+            channel.wait_eof()
+            channel.close()
+            channel.wait_closed()
+            exit_status = channel.get_exit_status()
+        finally:
+            session.disconnect()
+
+    return exit_status, b"".join(chunks)
+
+# ------------------------------------------------------------------------------
+# Footer Notes:
+# - Host keys are not verified, matching the Paramiko AutoAddPolicy used by
+#   the default backend.
+# - Connections are not pooled; each call performs a full handshake.
+# - MIT License applies.
+# ------------------------------------------------------------------------------
@@ -0,0 +1,63 @@
+# ------------------------------------------------------------------------------
+# File Name: credentials.py
+# Project: SSH Config Auditor
+# Author: _01x.arec1b0(dkrizhanovskyi)
+# License: MIT
+# Last Updated: 2024-12-25
+# Description:
+#   Derives non-reversible identifiers for SSH credentials used as cache keys.
+# ------------------------------------------------------------------------------
+
+"""
+credentials.py
+
+Provides credential_fingerprint, which lets in-memory caches (the connection
+pool and the audit result cache) tell credentials apart without holding them.
+Fingerprints are HMAC-SHA-256 under a random key generated per process, so
+they can't be matched against precomputed password hashes and are meaningless
+outside the process that made them.
+"""
+
+import hashlib
+import hmac
+import secrets
+
+_FINGERPRINT_KEY = secrets.token_bytes(32)
+
+
+def credential_fingerprint(password: str | None, key_id: str | None) -> str | None:
+    """
+    Derives a non-secret identifier for the credentials used to log in.
+
+    Args:
+        password (str | None): SSH password, if any.
+        key_id (str | None): Identifier of the private key in use (its public
+            fingerprint or file path), if any.
+
+    Returns:
+        str | None: A keyed digest of the credentials, or None if neither is given.
+    """
+    if password:
+        return "pw:" + _digest(password)
+    if key_id:
+        return "key:" + _digest(key_id)
+    return None
+
+
+def _digest(value: str) -> str:
+    """
+    Computes the per-process HMAC-SHA-256 of a string.
+
+    Args:
+        value (str): Value to digest.
+
+    Returns:
+        str: Hex-encoded digest.
+    """
+    return hmac.new(_FINGERPRINT_KEY, value.encode("utf-8"), hashlib.sha256).hexdigest()
+
+# ------------------------------------------------------------------------------
+# Footer Notes:
+# - The HMAC key never leaves memory and changes on every restart.
+# - MIT License applies.
+# ------------------------------------------------------------------------------
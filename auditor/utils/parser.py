@@ -15,7 +15,77 @@ Provides a set of utility functions to parse sshd_config content into a usable
 dictionary, as well as other helpers for validating or normalizing settings.
 """
 
-import re
+from typing import Collection, Iterable, Iterator
+
+_BOOL_MAP = {"yes": True, "on": True, "no": False, "off": False}
+MAX_LINE_LENGTH = 4096
+
+
+def iter_sshd_directives(lines: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """
+    Lazily yields directives from sshd_config lines as they arrive.
+
+    Lines longer than MAX_LINE_LENGTH are skipped, so the work done per line
+    is bounded and parsing stays linear in the size of the input.
+
+    Args:
+        lines (Iterable[str]): sshd_config lines, with or without line endings.
+
+    Yields:
+        tuple[str, str]: (directive, value) pairs in file order.
+    """
+    for line in lines:
+        if len(line) > MAX_LINE_LENGTH:
+            continue
+        stripped = line.lstrip()
+        if not stripped or stripped[0] == "#":
+            continue
+        parts = stripped.split(None, 1)
+        if len(parts) == 2 and parts[0].isalnum():
+            yield parts[0], parts[1].rstrip()
+
+
+def collect_sshd_directives(
+    lines: Iterable[bytes],
+    wanted: Collection[str]
+) -> dict[str, str]:
+    """
+    Gathers only the wanted directives, stopping once all of them are found.
+
+    Like sshd itself, the first value seen for a directive wins, so the rest
+    of the input never needs to be read once every wanted key is present.
+    Lines are first matched against the wanted names as literal prefixes, so
+    comments and unrelated directives are skipped without being split. Input
+    stays as raw bytes; only the captured values are decoded. Lines longer
+    than MAX_LINE_LENGTH are ignored, keeping hostile input linear-time.
+
+    Args:
+        lines (Iterable[bytes]): Raw sshd_config lines, with or without line
+            endings.
+        wanted (Collection[str]): Directive names to collect.
+
+    Returns:
+        dict[str, str]: The wanted directives that were found, with their values.
+    """
+    names = {name.encode("ascii"): name for name in wanted}
+    prefixes = tuple(names)
+    config_dict = {}
+    for line in lines:
+        if len(line) > MAX_LINE_LENGTH:
+            continue
+        stripped = line.lstrip()
+        if not stripped.startswith(prefixes):
+            continue
+        parts = stripped.split(None, 1)
+        if len(parts) != 2 or parts[0] not in names:
+            continue
+        key = names[parts[0]]
+        if key not in config_dict:
+            config_dict[key] = parts[1].rstrip().decode("ascii", "replace")
+            if len(config_dict) == len(names):
+                break
+    return config_dict
+
 
 def parse_sshd_config(config_data: str) -> dict[str, str]:
     """
@@ -25,16 +95,12 @@ def parse_sshd_config(config_data: str) -> dict[str, str]:
         config_data (str): The raw contents of sshd_config.
 
     Returns:
-        dict[str, str]: A dictionary of directives (keys) to their values.
+        dict[str, str]: A dictionary of directives (keys) to their values. As
+        in sshd, the first occurrence of a repeated directive wins.
     """
-    pattern = r"^\s*([A-Za-z0-9]+)\s+(.*)$"
     config_dict = {}
-    for line in config_data.split("\n"):
-        match = re.search(pattern, line)
-        if match:
-            key = match.group(1).strip()
-            value = match.group(2).strip()
-            config_dict[key] = value
+    for key, value in iter_sshd_directives(config_data.splitlines()):
+        config_dict.setdefault(key, value)
     return config_dict
 
 
@@ -65,12 +131,7 @@ def normalize_boolean_setting(value: str) -> bool | None:
     Returns:
         bool | None: True if 'yes'/'on', False if 'no'/'off', None if unrecognized.
     """
-    val_lower = value.strip().lower()
-    if val_lower in ["yes", "on"]:
-        return True
-    elif val_lower in ["no", "off"]:
-        return False
-    return None
+    return _BOOL_MAP.get(value.strip().lower())
 
 # ------------------------------------------------------------------------------
 # Footer Notes:
@@ -0,0 +1,223 @@
+# ------------------------------------------------------------------------------
+# File Name: ssh_pool.py
+# Project: SSH Config Auditor
+# Author: _01x.arec1b0(dkrizhanovskyi)
+# License: MIT
+# Last Updated: 2024-12-25
+# Description:
+#   Keeps authenticated Paramiko clients alive between audits so repeated
+#   audits of the same host skip the TCP + SSH key exchange handshake.
+# ------------------------------------------------------------------------------
+
+"""
+ssh_pool.py
+
+Provides SSHConnectionPool, a thread-safe cache of connected paramiko.SSHClient
+instances keyed by (host, port, username, auth fingerprint). Several idle
+clients may be kept per key, and idle clients are reaped lazily whenever the
+pool is touched.
+"""
+
+import atexit
+from collections import deque
+import threading
+import time
+
+import paramiko
+from auditor.utils.credentials import credential_fingerprint
+
+PoolKey = tuple[str, int, str, str | None]
+_AUTO_ADD = paramiko.AutoAddPolicy()
+KEEPALIVE_INTERVAL = 15
+
+
+class SSHConnectionPool:
+    """
+    Caches live SSH clients so they can be reused across audits.
+    """
+
+    def __init__(self, idle_timeout: float = 60.0, max_idle_per_key: int = 8) -> None:
+        """
+        Initializes an empty pool.
+
+        Args:
+            idle_timeout (float, optional): Seconds an unused client may stay
+                open before it is closed (default 60).
+            max_idle_per_key (int, optional): Idle clients kept per key, so
+                concurrent audits of one host can each reuse a connection
+                (default 8).
+        """
+        self.idle_timeout = idle_timeout
+        self.max_idle_per_key = max_idle_per_key
+        self._lock = threading.Lock()
+        self._idle: dict[PoolKey, deque[tuple[paramiko.SSHClient, float]]] = {}
+        self._in_use: dict[paramiko.SSHClient, PoolKey] = {}
+
+    def acquire(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str | None = None,
+        pkey: paramiko.PKey | None = None,
+        timeout: float = 2,
+        reuse: bool = True
+    ) -> paramiko.SSHClient:
+        """
+        Returns a connected client, reusing an idle one when possible.
+
+        Args:
+            host (str): Target server's hostname or IP address.
+            port (int): SSH port.
+            username (str): SSH username.
+            password (str | None, optional): SSH password (default None).
+            pkey (paramiko.PKey | None, optional): Private key (default None).
+            timeout (float, optional): TCP connect timeout in seconds (default 2).
+            reuse (bool, optional): Whether an idle client may be handed out;
+                False always opens a new connection (default True).
+
+        Returns:
+            paramiko.SSHClient: A client checked out for exclusive use until
+            it is handed back via release().
+        """
+        key_id = pkey.get_fingerprint().hex() if pkey is not None else None
+        key = (host, port, username, credential_fingerprint(password, key_id))
+        with self._lock:
+            stale = self._reap_locked()
+            client = self._pop_idle_locked(key) if reuse else None
+        for dead in stale:
+            dead.close()
+
+        while client is not None and not self._is_alive(client):
+            client.close()
+            with self._lock:
+                client = self._pop_idle_locked(key)
+
+        if client is None:
+            client = paramiko.SSHClient()
+            client.set_missing_host_key_policy(_AUTO_ADD)
+            try:
+                client.connect(
+                    hostname=host,
+                    port=port,
+                    username=username,
+                    password=password,
+                    pkey=pkey,
+                    timeout=timeout
+                )
+            except Exception:
+                client.close()
+                raise
+            # Keepalives stop idle pooled sessions from being dropped by NATs
+            # and let a dead peer show up as an inactive transport on reuse
+            client.get_transport().set_keepalive(KEEPALIVE_INTERVAL)
+
+        with self._lock:
+            self._in_use[client] = key
+        return client
+
+    def release(self, client: paramiko.SSHClient) -> None:
+        """
+        Hands a client back to the pool, closing it if it can't be reused.
+
+        Args:
+            client (paramiko.SSHClient): A client obtained from acquire().
+        """
+        with self._lock:
+            key = self._in_use.pop(client, None)
+            stale = self._reap_locked()
+            idle = self._idle.get(key) if key is not None else None
+            if (
+                key is None
+                or not self._is_alive(client)
+                or (idle is not None and len(idle) >= self.max_idle_per_key)
+            ):
+                stale.append(client)
+            else:
+                self._idle.setdefault(key, deque()).append((client, time.monotonic()))
+        for dead in stale:
+            dead.close()
+
+    def discard(self, client: paramiko.SSHClient) -> None:
+        """
+        Closes a checked-out client that turned out to be unusable, instead of
+        handing it back to the pool.
+
+        Args:
+            client (paramiko.SSHClient): A client obtained from acquire().
+        """
+        with self._lock:
+            self._in_use.pop(client, None)
+        client.close()
+
+    def close_all(self) -> None:
+        """
+        Closes every idle client held by the pool.
+        """
+        with self._lock:
+            idle = [client for entries in self._idle.values() for client, _ in entries]
+            self._idle.clear()
+        for client in idle:
+            client.close()
+
+    def _pop_idle_locked(self, key: PoolKey) -> paramiko.SSHClient | None:
+        """
+        Takes the most recently released idle client for key, if any. Caller
+        must hold the lock.
+
+        Args:
+            key (PoolKey): Pool key to look up.
+
+        Returns:
+            paramiko.SSHClient | None: An idle client, or None if there is none.
+        """
+        idle = self._idle.get(key)
+        if not idle:
+            return None
+        client, _ = idle.pop()
+        if not idle:
+            del self._idle[key]
+        return client
+
+    def _reap_locked(self) -> list[paramiko.SSHClient]:
+        """
+        Removes idle clients older than idle_timeout. Caller must hold the
+        lock, and must close the returned clients after releasing it.
+
+        Returns:
+            list[paramiko.SSHClient]: The expired clients.
+        """
+        cutoff = time.monotonic() - self.idle_timeout
+        expired = []
+        for key in list(self._idle):
+            idle = self._idle[key]
+            # Clients are appended on release, so the oldest sit on the left
+            while idle and idle[0][1] <= cutoff:
+                expired.append(idle.popleft()[0])
+            if not idle:
+                del self._idle[key]
+        return expired
+
+    @staticmethod
+    def _is_alive(client: paramiko.SSHClient) -> bool:
+        """
+        Checks whether the client's underlying transport is still usable.
+
+        Args:
+            client (paramiko.SSHClient): Client to inspect.
+
+        Returns:
+            bool: True if the transport is active, False otherwise.
+        """
+        transport = client.get_transport()
+        return transport is not None and transport.is_active()
+
+
+pool = SSHConnectionPool()
+atexit.register(pool.close_all)
+
+# ------------------------------------------------------------------------------
+# Footer Notes:
+# - Pool keys never contain raw passwords; see utils/credentials.py.
+# - MIT License applies.
+# ------------------------------------------------------------------------------
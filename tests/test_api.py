@@ -0,0 +1,23 @@
+"""
+test_api.py - Unit tests for the FastAPI request models.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from auditor.api import BatchAuditRequest
+from auditor.async_auditor import MAX_BATCH_HOSTS, MAX_PARALLEL_LIMIT
+
+
+def test_batch_request_bounds_concurrency_and_size():
+    """
+    Verify that a batch request can't ask for more parallel connections or
+    more hosts than the configured limits.
+    """
+    host = {"host": "10.0.0.1"}
+
+    BatchAuditRequest(hosts=[host], max_parallel=MAX_PARALLEL_LIMIT)
+    with pytest.raises(ValidationError):
+        BatchAuditRequest(hosts=[host], max_parallel=MAX_PARALLEL_LIMIT + 1)
+    with pytest.raises(ValidationError):
+        BatchAuditRequest(hosts=[host] * (MAX_BATCH_HOSTS + 1))
@@ -0,0 +1,192 @@
+"""
+test_async_auditor.py - Unit tests for concurrent multi-host auditing.
+Sockets, AsyncSSH and audit_one are replaced with fakes so no SSH servers are
+contacted.
+"""
+
+import asyncio
+import socket
+from types import SimpleNamespace
+
+import asyncssh
+import pytest
+from auditor import async_auditor
+from auditor.checks import ssh_config_checks
+
+
+def test_audit_hosts_preserves_order_and_reports_failures(monkeypatch):
+    """
+    Verify that audit_hosts returns results in request order and turns a
+    per-host exception into a ConnectionError entry.
+    """
+    async def fake_audit_one(host, **kwargs):
+        if host == "bad":
+            raise OSError("unreachable")
+        await asyncio.sleep(0.01 if host == "slow" else 0)
+        return {"PortConfig": host}
+
+    monkeypatch.setattr(async_auditor, "audit_one", fake_audit_one)
+    hosts = [{"host": "slow"}, {"host": "bad"}, {"host": "fast"}]
+
+    results = asyncio.run(async_auditor.audit_hosts(hosts))
+
+    assert results == [
+        {"PortConfig": "slow"},
+        {"ConnectionError": "unreachable"},
+        {"PortConfig": "fast"},
+    ]
+
+
+def test_audit_hosts_limits_concurrency(monkeypatch):
+    """
+    Verify that no more than max_parallel audits run at the same time.
+    """
+    running = 0
+    peak = 0
+
+    async def fake_audit_one(host, **kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {}
+
+    monkeypatch.setattr(async_auditor, "audit_one", fake_audit_one)
+    hosts = [{"host": f"10.0.0.{i}"} for i in range(10)]
+
+    asyncio.run(async_auditor.audit_hosts(hosts, max_parallel=3))
+
+    assert peak == 3
+
+
+ADDRESSES = [
+    (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.0.2.1", 22)),
+    (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.0.2.2", 22)),
+]
+
+
+def open_socket_with(monkeypatch, connect_results):
+    """
+    Runs _open_socket against fake DNS results, where connect_results maps
+    each address to "ok", "hang" or an exception to raise.
+    """
+    monkeypatch.setattr(async_auditor, "TCP_CONNECT_TIMEOUT", 0.01)
+    attempts = []
+
+    async def fake_getaddrinfo(host, port, type=0):
+        return ADDRESSES
+
+    async def fake_sock_connect(sock, addr):
+        attempts.append(sock)
+        outcome = connect_results[addr[0]]
+        if outcome == "hang":
+            await asyncio.sleep(10)
+        elif isinstance(outcome, Exception):
+            raise outcome
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        loop.getaddrinfo = fake_getaddrinfo
+        loop.sock_connect = fake_sock_connect
+        return await async_auditor._open_socket("example.test", 22)
+
+    return asyncio.run(run()), attempts
+
+
+def test_open_socket_falls_through_to_next_address(monkeypatch):
+    """
+    Verify that an address that doesn't answer in time is closed and the
+    next resolved address is tried.
+    """
+    sock, attempts = open_socket_with(
+        monkeypatch, {"192.0.2.1": "hang", "192.0.2.2": "ok"}
+    )
+
+    assert sock is attempts[1]
+    assert attempts[0].fileno() == -1
+    sock.close()
+
+
+def test_open_socket_raises_last_error_when_all_addresses_fail(monkeypatch):
+    """
+    Verify that timeouts become TimeoutError, connection errors propagate,
+    and every attempted socket is closed.
+    """
+    refused = ConnectionRefusedError("refused")
+
+    with pytest.raises(TimeoutError, match="timed out"):
+        open_socket_with(monkeypatch, {"192.0.2.1": refused, "192.0.2.2": "hang"})
+    with pytest.raises(ConnectionRefusedError):
+        open_socket_with(monkeypatch, {"192.0.2.1": "hang", "192.0.2.2": refused})
+
+
+class FakeSocket:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def audit_one_with(monkeypatch, outcome):
+    """
+    Runs audit_one with _open_socket and asyncssh.connect stubbed. outcome
+    is either (exit_status, stdout) for conn.run, or an exception to raise
+    from connect.
+    """
+    sock = FakeSocket()
+    calls = {}
+
+    async def fake_open_socket(host, port):
+        return sock
+
+    class FakeConnection:
+        async def __aenter__(self):
+            if isinstance(outcome, Exception):
+                raise outcome
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+        async def run(self, command, **kwargs):
+            calls["run"] = (command, kwargs)
+            exit_status, stdout = outcome
+            return SimpleNamespace(exit_status=exit_status, stdout=stdout)
+
+    def fake_connect(host, **kwargs):
+        calls["connect"] = kwargs
+        return FakeConnection()
+
+    monkeypatch.setattr(async_auditor, "_open_socket", fake_open_socket)
+    monkeypatch.setattr(async_auditor.asyncssh, "connect", fake_connect)
+    monkeypatch.setattr(ssh_config_checks, "_results_by_digest", {})
+    results = asyncio.run(async_auditor.audit_one("10.0.0.1", password="secret"))
+    return results, sock, calls
+
+
+def test_audit_one_audits_config_over_prepared_socket(monkeypatch):
+    """
+    Verify that audit_one hands its socket to AsyncSSH, reads the config as
+    bytes, and closes the socket afterwards.
+    """
+    results, sock, calls = audit_one_with(monkeypatch, (0, b"Port 2222\n"))
+
+    assert results["PortConfig"] == "Secure (Port 2222)"
+    assert calls["connect"]["sock"] is sock
+    assert calls["run"][1]["encoding"] is None
+    assert sock.closed
+
+
+def test_audit_one_reports_failed_cat_and_ssh_errors(monkeypatch):
+    """
+    Verify that a non-zero exit status gives the unreadable-config error and
+    an asyncssh.Error becomes a ConnectionError entry, closing the socket.
+    """
+    failed, _, _ = audit_one_with(monkeypatch, (1, b"Port 2222\n"))
+    errored, sock, _ = audit_one_with(monkeypatch, asyncssh.ConnectionLost("Connection lost"))
+
+    assert failed == {"Error": "Unable to retrieve sshd_config."}
+    assert errored == {"ConnectionError": "SSH error: Connection lost"}
+    assert sock.closed
@@ -0,0 +1,21 @@
+"""
+test_credentials.py - Unit tests for credential fingerprinting.
+"""
+
+import hashlib
+
+from auditor.utils.credentials import credential_fingerprint
+
+
+def test_credential_fingerprint_is_keyed_and_distinguishes_credentials():
+    """
+    Verify that fingerprints are stable within the process, differ between
+    credentials, and are not the plain SHA-256 of the password.
+    """
+    first = credential_fingerprint("secret", None)
+
+    assert first == credential_fingerprint("secret", None)
+    assert first != credential_fingerprint("changed", None)
+    assert first != credential_fingerprint(None, "secret")
+    assert first != "pw:" + hashlib.sha256(b"secret").hexdigest()
+    assert credential_fingerprint(None, None) is None
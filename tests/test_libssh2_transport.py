@@ -0,0 +1,176 @@
+"""
+test_libssh2_transport.py - Unit tests for the optional libssh2 backend.
+A fake ssh2 package is injected into sys.modules, so ssh2-python isn't needed.
+"""
+
+import importlib
+import sys
+import types
+
+import pytest
+from auditor.checks import ssh_config_checks
+from auditor.checks.ssh_config_checks import SSHConfigAuditor
+
+
+class FakeSSH2Error(Exception):
+    pass
+
+
+class FakeChannel:
+    def __init__(self, reads, exit_status) -> None:
+        self.reads = list(reads)
+        self.exit_status = exit_status
+        self.command = None
+
+    def execute(self, command) -> None:
+        self.command = command
+
+    def read(self):
+        return self.reads.pop(0)
+
+    def wait_eof(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def wait_closed(self) -> None:
+        pass
+
+    def get_exit_status(self) -> int:
+        return self.exit_status
+
+
+class FakeSession:
+    instances = []
+    reads = [(0, b"")]
+    exit_status = 0
+    auth_error = None
+
+    def __init__(self) -> None:
+        self.channel = FakeChannel(FakeSession.reads, FakeSession.exit_status)
+        self.auth = None
+        self.disconnected = False
+        FakeSession.instances.append(self)
+
+    def set_timeout(self, timeout) -> None:
+        pass
+
+    def handshake(self, sock) -> None:
+        pass
+
+    def userauth_password(self, username, password) -> None:
+        if FakeSession.auth_error is not None:
+            raise FakeSession.auth_error
+        self.auth = ("password", username)
+
+    def userauth_publickey_fromfile(self, username, key_file) -> None:
+        self.auth = ("key", username, key_file)
+
+    def agent_auth(self, username) -> None:
+        self.auth = ("agent", username)
+
+    def open_session(self) -> FakeChannel:
+        return self.channel
+
+    def disconnect(self) -> None:
+        self.disconnected = True
+
+
+class FakeSocket:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    FakeSession.instances = []
+    FakeSession.reads = [(0, b"")]
+    FakeSession.exit_status = 0
+    FakeSession.auth_error = None
+
+    ssh2 = types.ModuleType("ssh2")
+    session = types.ModuleType("ssh2.session")
+    session.Session = FakeSession
+    exceptions = types.ModuleType("ssh2.exceptions")
+    exceptions.SSH2Error = FakeSSH2Error
+    error_codes = types.ModuleType("ssh2.error_codes")
+    error_codes.LIBSSH2_ERROR_EAGAIN = -37
+    for name, module in [
+        ("ssh2", ssh2),
+        ("ssh2.session", session),
+        ("ssh2.exceptions", exceptions),
+        ("ssh2.error_codes", error_codes),
+    ]:
+        monkeypatch.setitem(sys.modules, name, module)
+    monkeypatch.delitem(sys.modules, "auditor.transports.libssh2_transport", raising=False)
+
+    module = importlib.import_module("auditor.transports.libssh2_transport")
+    monkeypatch.setattr(module.socket, "create_connection", lambda *args, **kwargs: FakeSocket())
+    monkeypatch.setattr(ssh_config_checks, "_results_by_digest", {})
+    yield module
+    sys.modules.pop("auditor.transports.libssh2_transport", None)
+
+
+def test_run_command_collects_output_and_exit_status(transport):
+    """
+    Verify that run_command concatenates every chunk read from the channel,
+    returns the exit status, and disconnects.
+    """
+    FakeSession.reads = [(5, b"Port "), (5, b"2222\n"), (0, b"")]
+    FakeSession.exit_status = 1
+
+    result = transport.run_command("10.0.0.1", 22, "root", "cat x", key_file="/k")
+
+    session = FakeSession.instances[0]
+    assert result == (1, b"Port 2222\n")
+    assert session.channel.command == "cat x"
+    assert session.auth == ("key", "root", "/k")
+    assert session.disconnected
+
+
+def test_run_command_raises_on_read_error(transport):
+    """
+    Verify that a negative read() code is an error, not a silent EOF, and
+    that the session is still disconnected.
+    """
+    FakeSession.reads = [(5, b"Port "), (-9, b"")]
+
+    with pytest.raises(FakeSSH2Error):
+        transport.run_command("10.0.0.1", 22, "root", "cat x")
+
+    assert FakeSession.instances[0].disconnected
+
+
+def test_audit_dispatches_to_libssh2_backend(transport, monkeypatch):
+    """
+    Verify that AUDITOR_SSH_BACKEND=libssh2 routes audit_ssh_config through
+    run_command instead of the Paramiko pool.
+    """
+    FakeSession.reads = [(10, b"Port 2222\n"), (0, b"")]
+    monkeypatch.setattr(ssh_config_checks, "SSH_BACKEND", "libssh2")
+    monkeypatch.setattr(ssh_config_checks.pool, "acquire", None)
+
+    results = SSHConfigAuditor("10.0.0.1", "root").audit_ssh_config()
+
+    assert results["PortConfig"] == "Secure (Port 2222)"
+    assert FakeSession.instances[0].auth == ("agent", "root")
+
+
+def test_libssh2_audit_reports_failures(transport, monkeypatch):
+    """
+    Verify that a failed cat yields the unreadable-config error and that an
+    SSH2Error becomes a ConnectionError entry.
+    """
+    monkeypatch.setattr(ssh_config_checks, "SSH_BACKEND", "libssh2")
+    auditor = SSHConfigAuditor("10.0.0.1", "root", password="secret")
+
+    FakeSession.reads = [(10, b"Port 2222\n"), (0, b"")]
+    FakeSession.exit_status = 1
+    assert auditor.audit_ssh_config() == {"Error": "Unable to retrieve sshd_config."}
+
+    FakeSession.auth_error = FakeSSH2Error()
+    assert auditor.audit_ssh_config() == {"ConnectionError": "SSH error: FakeSSH2Error"}
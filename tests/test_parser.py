@@ -0,0 +1,91 @@
+"""
+test_parser.py - Unit tests for the sshd_config parsing helpers.
+"""
+
+from auditor.utils.parser import (
+    MAX_LINE_LENGTH,
+    collect_sshd_directives,
+    parse_sshd_config
+)
+
+
+def test_parse_sshd_config():
+    """
+    Verify that parse_sshd_config:
+    - Extracts key/value directives, trimming surrounding whitespace.
+    - Skips comments and blank lines.
+    - Handles CRLF line endings.
+    """
+    config_data = (
+        "# This is the sshd server system-wide configuration file.\r\n"
+        "\r\n"
+        "Port 2222\r\n"
+        "  PasswordAuthentication   no  \r\n"
+        "#PermitRootLogin yes\r\n"
+        "PermitRootLogin\tprohibit-password\r\n"
+    )
+
+    assert parse_sshd_config(config_data) == {
+        "Port": "2222",
+        "PasswordAuthentication": "no",
+        "PermitRootLogin": "prohibit-password",
+    }
+
+
+def test_parse_sshd_config_ignores_malformed_lines():
+    """
+    Verify that lines without a value or with a non-alphanumeric key are ignored.
+    """
+    config_data = "Port\nSome-Key value\nUsePAM yes\n"
+
+    assert parse_sshd_config(config_data) == {"UsePAM": "yes"}
+
+
+def test_parse_sshd_config_first_value_wins():
+    """
+    Verify that a repeated directive keeps its first value, as sshd does.
+    """
+    config_data = "Port 2222\nPort 22\n"
+
+    assert parse_sshd_config(config_data) == {"Port": "2222"}
+
+
+def test_collect_sshd_directives_stops_once_all_found():
+    """
+    Verify that collect_sshd_directives keeps only the wanted keys and stops
+    consuming input once every one of them has been seen.
+    """
+    lines = iter([
+        b"UsePAM yes\n",
+        b"Port 2222\n",
+        b"PermitRootLogin no\n",
+        b"Port 22\n",
+        b"# tail that should never be read\n",
+    ])
+
+    result = collect_sshd_directives(lines, {"Port", "PermitRootLogin"})
+
+    assert result == {"Port": "2222", "PermitRootLogin": "no"}
+    assert next(lines) == b"Port 22\n"
+
+
+def test_collect_sshd_directives_matches_whole_names():
+    """
+    Verify that a directive sharing a prefix with a wanted name, a comment,
+    or a keyword without a value is not mistaken for the wanted directive.
+    """
+    lines = [b"PortForwarding yes", b"#Port 22", b"Port", b"\tPort 2222"]
+
+    assert collect_sshd_directives(lines, {"Port"}) == {"Port": "2222"}
+
+
+def test_overlong_lines_are_ignored():
+    """
+    Verify that lines longer than MAX_LINE_LENGTH are skipped by both parsers.
+    """
+    padding = " " * MAX_LINE_LENGTH
+
+    assert parse_sshd_config(f"Port{padding}2222\nUsePAM yes\n") == {"UsePAM": "yes"}
+    assert collect_sshd_directives(
+        [f"Port{padding}2222".encode(), b"Port 22"], {"Port"}
+    ) == {"Port": "22"}
@@ -0,0 +1,22 @@
+"""
+test_pdf_generator.py - Smoke test for the ReportLab PDF report.
+"""
+
+import re
+
+from auditor.reports.pdf_generator import generate_pdf_report
+
+
+def test_generate_pdf_report_paginates_long_results(tmp_path):
+    """
+    Verify that a report with more rows than fit on one page is written as
+    a valid, multi-page PDF.
+    """
+    results = {f"Check{i}": "Secure" for i in range(200)}
+    output_file = tmp_path / "report.pdf"
+
+    assert generate_pdf_report(results, str(output_file)) == str(output_file)
+
+    data = output_file.read_bytes()
+    assert data.startswith(b"%PDF-")
+    assert len(re.findall(rb"/Type /Page(?!s)", data)) > 1
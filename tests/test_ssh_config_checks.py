@@ -3,8 +3,10 @@ test_ssh_config_checks.py - Unit tests for the SSHConfigAuditor class.
 We’ll primarily test the static config parsing methods here.
 """
 
+import paramiko
 import pytest
-from auditor.checks.ssh_config_checks import SSHConfigAuditor
+from auditor.checks import ssh_config_checks
+from auditor.checks.ssh_config_checks import SSHConfigAuditor, audit
 
 def test_check_password_auth():
     """
@@ -59,3 +61,268 @@ def test_check_port_config():
     assert auditor.check_port(config_data_custom_port) == "Secure (Port 2222)"
     assert auditor.check_port(config_data_default) == "Default (Port 22)"
 
+
+def test_audit_caches_results_per_credentials(monkeypatch):
+    """
+    Verify that audit() reuses a fresh result for the same host and
+    credentials, re-audits for different credentials or once the TTL has
+    passed, and never caches connection errors.
+    """
+    calls = []
+
+    def fake_audit_ssh_config(self):
+        calls.append((self.host, self.password))
+        if self.host == "down":
+            return {"ConnectionError": "SSH error: refused"}
+        return {"PortConfig": "Default (Port 22)"}
+
+    monkeypatch.setattr(SSHConfigAuditor, "audit_ssh_config", fake_audit_ssh_config)
+    monkeypatch.setattr(ssh_config_checks, "_audit_cache", {})
+
+    audit("10.0.0.1", "root", password="secret")
+    audit("10.0.0.1", "root", password="secret")
+    audit("10.0.0.1", "root", password="changed")
+    audit("down", "root")
+    audit("down", "root")
+    assert calls == [
+        ("10.0.0.1", "secret"),
+        ("10.0.0.1", "changed"),
+        ("down", None),
+        ("down", None),
+    ]
+
+    monkeypatch.setattr(ssh_config_checks, "AUDIT_CACHE_TTL", 0)
+    audit("10.0.0.1", "root", password="secret")
+    assert len(calls) == 5
+
+
+def test_load_key_is_reused_until_file_changes(monkeypatch):
+    """
+    Verify that a private key is parsed once per (path, mtime) pair.
+    """
+    loads = []
+
+    def fake_from_path(path):
+        loads.append(path)
+        return object()
+
+    monkeypatch.setattr(ssh_config_checks.paramiko.PKey, "from_path", fake_from_path)
+    ssh_config_checks._load_key.cache_clear()
+
+    first = ssh_config_checks._load_key("/keys/id_ed25519", 1.0)
+    again = ssh_config_checks._load_key("/keys/id_ed25519", 1.0)
+    edited = ssh_config_checks._load_key("/keys/id_ed25519", 2.0)
+    ssh_config_checks._load_key.cache_clear()
+
+    assert first is again
+    assert edited is not first
+    assert loads == ["/keys/id_ed25519", "/keys/id_ed25519"]
+
+
+def test_evaluate_config_reuses_results_for_identical_content(monkeypatch):
+    """
+    Verify that evaluate_config parses a given sshd_config only once, and
+    that callers get their own copy of the cached results.
+    """
+    evaluated = []
+    original = SSHConfigAuditor.evaluate_directives.__func__
+
+    def counting_evaluate_directives(cls, config_dict):
+        evaluated.append(config_dict)
+        return original(cls, config_dict)
+
+    monkeypatch.setattr(
+        SSHConfigAuditor, "evaluate_directives", classmethod(counting_evaluate_directives)
+    )
+    monkeypatch.setattr(ssh_config_checks, "_results_by_digest", {})
+
+    first = SSHConfigAuditor.evaluate_config(b"Port 2222\n")
+    first["PortConfig"] = "tampered"
+    second = SSHConfigAuditor.evaluate_config(b"Port 2222\n")
+    SSHConfigAuditor.evaluate_config(b"Port 2200\n")
+
+    assert second["PortConfig"] == "Secure (Port 2222)"
+    assert evaluated == [{"Port": "2222"}, {"Port": "2200"}]
+
+
+class FakeStdout:
+    def __init__(self, lines, error=None) -> None:
+        self.lines = list(lines)
+        self.error = error
+        self.consumed = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    def readline(self) -> bytes:
+        if self.error is not None:
+            raise self.error
+        if not self.lines:
+            return b""
+        self.consumed += 1
+        return self.lines.pop(0)
+
+    def __iter__(self):
+        return iter(self.readline, b"")
+
+
+class FakeChannel:
+    def __init__(self, stdout, exit_status=0) -> None:
+        self.stdout = stdout
+        self.exit_status = exit_status
+        self.status_checked = False
+        self.closed = False
+
+    def settimeout(self, timeout) -> None:
+        pass
+
+    def exec_command(self, command) -> None:
+        self.command = command
+
+    def makefile(self, mode) -> FakeStdout:
+        return self.stdout
+
+    def recv_exit_status(self) -> int:
+        self.status_checked = True
+        return self.exit_status
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeSSHTransport:
+    def __init__(self, channel) -> None:
+        self.channel = channel
+
+    def open_session(self, timeout=None) -> FakeChannel:
+        if isinstance(self.channel, Exception):
+            raise self.channel
+        return self.channel
+
+
+class FakeSSHClient:
+    def __init__(self, channel) -> None:
+        self.transport = FakeSSHTransport(channel)
+
+    def get_transport(self) -> FakeSSHTransport:
+        return self.transport
+
+
+class FakePool:
+    def __init__(self, *channels) -> None:
+        self.channels = list(channels)
+        self.reuse_flags = []
+        self.released = []
+        self.discarded = []
+
+    def acquire(self, host, port, username, reuse=True, **kwargs) -> FakeSSHClient:
+        self.reuse_flags.append(reuse)
+        return FakeSSHClient(self.channels.pop(0))
+
+    def release(self, client) -> None:
+        self.released.append(client)
+
+    def discard(self, client) -> None:
+        self.discarded.append(client)
+
+
+def run_paramiko_audit(monkeypatch, *channels):
+    fake_pool = FakePool(*channels)
+    monkeypatch.setattr(ssh_config_checks, "SSH_BACKEND", "paramiko")
+    monkeypatch.setattr(ssh_config_checks, "pool", fake_pool)
+    results = SSHConfigAuditor(host="10.0.0.1", username="root").audit_ssh_config()
+    return results, fake_pool
+
+
+def test_audit_ssh_config_hangs_up_once_all_directives_are_found(monkeypatch):
+    """
+    Verify that the exec channel is read only until every checked directive
+    has been seen, that the exit status isn't waited for, and that the
+    channel is closed and the client released.
+    """
+    stdout = FakeStdout([
+        b"Port 2222\n",
+        b"PasswordAuthentication no\n",
+        b"PermitRootLogin no\n",
+        b"# tail that should never be read\n",
+    ])
+    channel = FakeChannel(stdout)
+
+    results, fake_pool = run_paramiko_audit(monkeypatch, channel)
+
+    assert results == {
+        "PortConfig": "Secure (Port 2222)",
+        "PasswordAuthentication": "Secure",
+        "RootLogin": "Secure",
+    }
+    assert stdout.consumed == 3
+    assert not channel.status_checked
+    assert channel.closed
+    assert len(fake_pool.released) == 1
+
+
+def test_audit_ssh_config_checks_exit_status_after_full_read(monkeypatch):
+    """
+    Verify that a file read to the end is audited when cat succeeded, and
+    reported as unreadable when cat failed.
+    """
+    ok = FakeChannel(FakeStdout([b"Port 2222\n"]))
+    failed = FakeChannel(FakeStdout([b"Port 2222\n"]), exit_status=1)
+
+    ok_results, _ = run_paramiko_audit(monkeypatch, ok)
+    failed_results, _ = run_paramiko_audit(monkeypatch, failed)
+
+    assert ok.status_checked and ok_results["PortConfig"] == "Secure (Port 2222)"
+    assert failed_results == {"Error": "Unable to retrieve sshd_config."}
+    assert failed.closed
+
+
+def test_audit_ssh_config_treats_empty_and_timed_out_reads_as_unreadable(monkeypatch):
+    """
+    Verify that an empty sshd_config and a read timeout both give the same
+    error as evaluate_config(b""), and that the channel is still closed.
+    """
+    empty = FakeChannel(FakeStdout([]))
+    timed_out = FakeChannel(FakeStdout([], error=TimeoutError()))
+
+    empty_results, _ = run_paramiko_audit(monkeypatch, empty)
+    timed_out_results, _ = run_paramiko_audit(monkeypatch, timed_out)
+
+    unreadable = SSHConfigAuditor.evaluate_config(b"")
+    assert empty_results == unreadable
+    assert timed_out_results == unreadable
+    assert empty.closed and timed_out.closed
+
+
+def test_audit_ssh_config_retries_on_a_new_connection_when_session_fails(monkeypatch):
+    """
+    Verify that a pooled client whose open_session() fails is discarded and
+    the audit is retried once on a freshly opened connection.
+    """
+    dead = paramiko.SSHException("channel open failed")
+    channel = FakeChannel(FakeStdout([b"Port 2222\n"]))
+
+    results, fake_pool = run_paramiko_audit(monkeypatch, dead, channel)
+
+    assert results["PortConfig"] == "Secure (Port 2222)"
+    assert fake_pool.reuse_flags == [True, False]
+    assert len(fake_pool.discarded) == 1
+    assert len(fake_pool.released) == 1
+
+
+def test_audit_ssh_config_reports_error_when_retry_also_fails(monkeypatch):
+    """
+    Verify that only one retry is made and its failure becomes a
+    ConnectionError entry.
+    """
+    first = paramiko.SSHException("channel open failed")
+    second = paramiko.SSHException("still failing")
+
+    results, fake_pool = run_paramiko_audit(monkeypatch, first, second)
+
+    assert results == {"ConnectionError": "SSH error: still failing"}
+    assert fake_pool.reuse_flags == [True, False]
+    assert len(fake_pool.released) == 1
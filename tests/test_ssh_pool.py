@@ -0,0 +1,133 @@
+"""
+test_ssh_pool.py - Unit tests for the SSHConnectionPool.
+Paramiko clients are replaced with fakes so no network access is needed.
+"""
+
+import pytest
+from auditor.utils import ssh_pool
+from auditor.utils.ssh_pool import SSHConnectionPool
+
+
+class FakeTransport:
+    def __init__(self) -> None:
+        self.active = True
+
+    def is_active(self) -> bool:
+        return self.active
+
+    def set_keepalive(self, interval: int) -> None:
+        self.keepalive = interval
+
+
+class FakeClient:
+    instances = []
+
+    def __init__(self) -> None:
+        self.transport = FakeTransport()
+        self.closed = False
+        FakeClient.instances.append(self)
+
+    def set_missing_host_key_policy(self, policy) -> None:
+        pass
+
+    def connect(self, **kwargs) -> None:
+        self.connect_kwargs = kwargs
+
+    def get_transport(self) -> FakeTransport:
+        return self.transport
+
+    def close(self) -> None:
+        self.closed = True
+        self.transport.active = False
+
+
+@pytest.fixture(autouse=True)
+def fake_paramiko(monkeypatch):
+    FakeClient.instances = []
+    monkeypatch.setattr(ssh_pool.paramiko, "SSHClient", FakeClient)
+
+
+def test_pool_reuses_released_client():
+    """
+    Verify that a released client is handed out again for the same key,
+    but not for a different user or different credentials.
+    """
+    pool = SSHConnectionPool()
+
+    first = pool.acquire("10.0.0.1", 22, "root", password="secret")
+    pool.release(first)
+    second = pool.acquire("10.0.0.1", 22, "root", password="secret")
+    pool.release(second)
+    other_user = pool.acquire("10.0.0.1", 22, "admin", password="secret")
+    other_pw = pool.acquire("10.0.0.1", 22, "root", password="changed")
+
+    assert second is first
+    assert first.transport.keepalive == ssh_pool.KEEPALIVE_INTERVAL
+    assert other_user is not first
+    assert other_pw is not first
+    assert len(FakeClient.instances) == 3
+
+
+def test_pool_replaces_dead_client():
+    """
+    Verify that an idle client whose transport dropped is closed and replaced.
+    """
+    pool = SSHConnectionPool()
+
+    first = pool.acquire("10.0.0.1", 22, "root")
+    pool.release(first)
+    first.transport.active = False
+    second = pool.acquire("10.0.0.1", 22, "root")
+
+    assert second is not first
+    assert first.closed
+
+
+def test_pool_reaps_idle_clients():
+    """
+    Verify that clients idle longer than idle_timeout are closed.
+    """
+    pool = SSHConnectionPool(idle_timeout=0)
+
+    first = pool.acquire("10.0.0.1", 22, "root")
+    pool.release(first)
+    second = pool.acquire("10.0.0.1", 22, "root")
+
+    assert first.closed
+    assert second is not first
+
+
+def test_pool_keeps_several_idle_clients_per_key():
+    """
+    Verify that clients used concurrently for one host are all kept for
+    reuse, up to max_idle_per_key, and the surplus is closed.
+    """
+    pool = SSHConnectionPool(max_idle_per_key=2)
+
+    clients = [pool.acquire("10.0.0.1", 22, "root") for _ in range(3)]
+    for client in clients:
+        pool.release(client)
+    reused = [pool.acquire("10.0.0.1", 22, "root") for _ in range(2)]
+
+    assert not clients[0].closed and not clients[1].closed
+    assert clients[2].closed
+    assert set(reused) == {clients[0], clients[1]}
+    assert len(FakeClient.instances) == 3
+
+
+def test_pool_can_skip_idle_clients_and_discard():
+    """
+    Verify that reuse=False opens a new connection even when an idle one
+    exists, and that a discarded client is closed rather than pooled.
+    """
+    pool = SSHConnectionPool()
+
+    first = pool.acquire("10.0.0.1", 22, "root")
+    pool.release(first)
+    fresh = pool.acquire("10.0.0.1", 22, "root", reuse=False)
+    pool.discard(fresh)
+    again = pool.acquire("10.0.0.1", 22, "root")
+
+    assert fresh is not first
+    assert fresh.closed
+    assert again is first